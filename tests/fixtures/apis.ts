@@ -58,11 +58,16 @@ export const mockApis: ApiEndpoint[] = [
 	}
 ];
 
+/**
+ * APIs indexed by ID for constant-time lookups from MSW handlers
+ */
+const mockApisById = new Map(mockApis.map((api) => [api.id, api]));
+
 /**
  * Get an API by ID
  */
 export function getApiById(id: string): ApiEndpoint | undefined {
-	return mockApis.find((api) => api.id === id);
+	return mockApisById.get(id);
 }
 
 /**
@@ -21,11 +21,16 @@ export type { Field, FieldValidator } from '../../src/lib/stores/initialData';
  */
 export const mockFields = cloneFields(initialFields);
 
+/**
+ * Fields indexed by ID for constant-time lookups from MSW handlers
+ */
+const mockFieldsById = new Map(mockFields.map((field) => [field.id, field]));
+
 /**
  * Get a field by ID
  */
 export function getFieldById(id: string): Field | undefined {
-	return mockFields.find((field) => field.id === id);
+	return mockFieldsById.get(id);
 }
 
 /**
@@ -90,11 +90,16 @@ export const mockFieldTypes: FieldType[] = mockTypes.map((type, index) => ({
 	usedInFields: index % 3 === 0 ? 5 : index % 2 === 0 ? 2 : 0
 }));
 
+/**
+ * Types indexed by name for constant-time lookups from MSW handlers
+ */
+const mockTypesByName = new Map(mockTypes.map((type) => [type.name, type]));
+
 /**
  * Get a type by name
  */
 export function getTypeByName(name: TypeName): TypeBase | undefined {
-	return mockTypes.find((type) => type.name === name);
+	return mockTypesByName.get(name);
 }
 
 /**
@@ -44,11 +44,16 @@ export const mockUsers: MockUser[] = [
 	}
 ];
 
+/**
+ * Users indexed by ID for constant-time lookups from MSW handlers
+ */
+const mockUsersById = new Map(mockUsers.map((user) => [user.id, user]));
+
 /**
  * Get a user by ID
  */
 export function getUserById(id: string): MockUser | undefined {
-	return mockUsers.find((user) => user.id === id);
+	return mockUsersById.get(id);
 }
 
 /**
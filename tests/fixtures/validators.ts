@@ -45,11 +45,18 @@ export const mockValidators: Validator[] = mockValidatorBases.map((base, index)
 			: [{ name: 'username', fieldId: 'field-2' }]
 }));
 
+/**
+ * Validators indexed by name for constant-time lookups from MSW handlers
+ */
+const mockValidatorsByName = new Map(
+	mockValidators.map((validator) => [validator.name, validator])
+);
+
 /**
  * Get a validator by name
  */
 export function getValidatorByName(name: string): Validator | undefined {
-	return mockValidators.find((validator) => validator.name === name);
+	return mockValidatorsByName.get(name);
 }
 
 /**